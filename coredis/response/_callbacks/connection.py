@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from coredis._utils import EncodingInsensitiveDict
 from coredis.response._callbacks import ResponseCallback
-from coredis.response._utils import flat_pairs_to_dict
 from coredis.typing import (
     AnyStr,
     Dict,
@@ -14,6 +12,10 @@ from coredis.typing import (
     ValueT,
 )
 
+#: The ``flags`` key of a CLIENT TRACKINGINFO reply, as bytes or decoded
+#: depending on the client's decoding configuration.
+_FLAGS_KEYS = (b"flags", "flags")
+
 
 class ClientTrackingInfoCallback(
     ResponseCallback[
@@ -25,11 +27,16 @@ class ClientTrackingInfoCallback(
     def transform(
         self, response: ResponseType, **options: Optional[ValueT]
     ) -> Dict[AnyStr, Union[AnyStr, Set[AnyStr], List[AnyStr]]]:
-        response = EncodingInsensitiveDict(flat_pairs_to_dict(response))
-        response["flags"] = set(response["flags"])
-        return dict(response)
+        it = iter(response)
+        transformed = {}
+        for key in it:
+            value = next(it)
+            transformed[key] = {*value} if key in _FLAGS_KEYS else value
+        return transformed
 
     def transform_3(
         self, response: ResponseType, **options: Optional[ValueT]
     ) -> Dict[AnyStr, Union[AnyStr, Set[AnyStr], List[AnyStr]]]:
+        # The RESP3 reply is already a map; return it as parsed without
+        # copying.
         return response
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import uuid
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 # 3rd party imports
 import pytest
@@ -291,14 +291,6 @@ async def test_reset(redis_cluster):
     Test that reset method resets variables back to correct default values.
     """
 
-    class AsyncMock(Mock):
-        def __await__(self):
-            future = asyncio.Future(loop=asyncio.get_event_loop())
-            future.set_result(self)
-            result = yield from future
-
-            return result
-
     n = NodeManager(startup_nodes=[{}])
     n.initialize = AsyncMock()
     await n.reset()
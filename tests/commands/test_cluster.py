@@ -77,14 +77,14 @@ class TestCluster:
 
     @pytest.mark.replicated_clusteronly
     async def test_cluster_info(self, client, _s):
-        info = await client.cluster_info()
-        assert info["cluster_state"] == "ok"
-
-        info = await list(client.replicas)[0].cluster_info()
-        assert info["cluster_state"] == "ok"
+        replica = list(client.replicas)[0]
+        primary = list(client.primaries)[0]
+        infos = await asyncio.gather(
+            client.cluster_info(), replica.cluster_info(), primary.cluster_info()
+        )
 
-        info = await list(client.primaries)[0].cluster_info()
-        assert info["cluster_state"] == "ok"
+        for info in infos:
+            assert info["cluster_state"] == "ok"
 
     async def test_cluster_keyslot(self, client, _s):
         slot = await client.cluster_keyslot("a")
@@ -110,11 +110,12 @@ class TestCluster:
     @pytest.mark.min_server_version("7.0.0")
     @pytest.mark.replicated_clusteronly
     async def test_cluster_links(self, client, _s):
-        links = []
-        for node in client.primaries:
-            links.append(await node.cluster_links())
-        for node in client.replicas:
-            links.append(await node.cluster_links())
+        links = await asyncio.gather(
+            *[
+                node.cluster_links()
+                for node in list(client.primaries) + list(client.replicas)
+            ]
+        )
         assert len(links) > 0
 
     async def test_cluster_meet(self, client, _s):
@@ -125,12 +126,7 @@ class TestCluster:
             await node.cluster_meet("bogus", 6666)
 
     async def test_cluster_my_id(self, client, _s):
-        ids = []
-        for node in client.primaries:
-            ids.append(node.cluster_myid())
-        for node in client.replicas:
-            ids.append(node.cluster_myid())
-        ids = await asyncio.gather(*ids)
+        ids = await asyncio.gather(*(node.cluster_myid() for node in client.all_nodes))
         known_nodes = (
             _s(node.node_id) for node in client.connection_pool.nodes.all_nodes()
         )
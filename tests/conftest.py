@@ -6,7 +6,7 @@ import os
 import platform
 import socket
 import time
-from functools import total_ordering
+from functools import lru_cache, total_ordering
 
 import pytest
 import redis
@@ -71,6 +71,11 @@ def event_loop():
     loop.close()
 
 
+@lru_cache(maxsize=None)
+def parse_version(version_string):
+    return version.parse(version_string)
+
+
 @total_ordering
 class UnparseableVersion:
     def __init__(self, version: str):
@@ -134,34 +139,33 @@ async def get_version(client):
 
 
 async def check_test_constraints(request, client, protocol=3):
-    await get_version(client)
-    await get_module_versions(client)
+    await asyncio.gather(get_version(client), get_module_versions(client))
     client_version = REDIS_VERSIONS[str(client)]
     for marker in request.node.iter_markers():
         if marker.name == "min_python" and marker.args:
-            if PY_VERSION < version.parse(marker.args[0]):
+            if PY_VERSION < parse_version(marker.args[0]):
                 return pytest.skip(f"Skipped for python versions < {marker.args[0]}")
 
         if marker.name == "min_server_version" and marker.args:
-            if client_version < version.parse(marker.args[0]):
+            if client_version < parse_version(marker.args[0]):
                 return pytest.skip(f"Skipped for versions < {marker.args[0]}")
 
         if marker.name == "max_server_version" and marker.args:
-            if client_version > version.parse(marker.args[0]):
+            if client_version > parse_version(marker.args[0]):
                 return pytest.skip(f"Skipped for versions > {marker.args[0]}")
 
         if marker.name == "min_module_version" and marker.args:
             name, ver = marker.args[0], marker.args[1]
             cur_ver = MODULE_VERSIONS.get(str(client), {}).get(name)
 
-            if not cur_ver or cur_ver < version.parse(ver):
+            if not cur_ver or cur_ver < parse_version(ver):
                 return pytest.skip(f"Skipped for module {name} versions < {ver}")
 
         if marker.name == "max_module_version" and marker.args:
             name, ver = marker.args[0], marker.args[1]
             cur_ver = MODULE_VERSIONS.get(str(client), {}).get(name)
 
-            if not cur_ver or cur_ver > version.parse(ver):
+            if not cur_ver or cur_ver > parse_version(ver):
                 return pytest.skip(f"Skipped for module {name} versions > {ver}")
 
         if marker.name == "nocluster" and isinstance(client, coredis.RedisCluster):
@@ -190,7 +194,7 @@ async def check_test_constraints(request, client, protocol=3):
         ):
             return pytest.skip(f"Skipped for {platform.system()}")
 
-        if protocol == 3 and client_version < version.parse("6.0.0"):
+        if protocol == 3 and client_version < parse_version("6.0.0"):
             return pytest.skip(f"Skipped RESP3 for {client_version}")
 
         if marker.name == "noresp3" and protocol == 3:
@@ -216,14 +220,18 @@ async def set_default_test_config(client, variant=None):
     await get_version(client)
 
     if isinstance(client, coredis.sentinel.Sentinel):
-        if REDIS_VERSIONS[str(client)] >= version.parse("6.2.0"):
+        if REDIS_VERSIONS[str(client)] >= parse_version("6.2.0"):
             await client.sentinels[0].sentinel_config_set("resolve-hostnames", "yes")
     else:
         if not variant:
-            await client.config_set({"maxmemory-policy": "noeviction"})
-            await client.config_set({"latency-monitor-threshold": 10})
+            # Setting multiple parameters in one CONFIG SET call requires
+            # redis 7.0+
+            await asyncio.gather(
+                client.config_set({"maxmemory-policy": "noeviction"}),
+                client.config_set({"latency-monitor-threshold": 10}),
+            )
 
-            if REDIS_VERSIONS[str(client)] >= version.parse("6.0.0"):
+            if REDIS_VERSIONS[str(client)] >= parse_version("6.0.0"):
                 await client.acl_log(reset=True)
 
 
@@ -812,8 +820,9 @@ async def redis_cluster(redis_cluster_server, request):
     await cluster.flushall()
     await cluster.flushdb()
 
-    for primary in cluster.primaries:
-        await set_default_test_config(primary)
+    await asyncio.gather(
+        *(set_default_test_config(primary) for primary in cluster.primaries)
+    )
 
     async with remapped_slots(cluster, request):
         yield cluster
@@ -835,8 +844,9 @@ async def redis_cluster_auth(redis_cluster_auth_server, request):
     await cluster.flushall()
     await cluster.flushdb()
 
-    for primary in cluster.primaries:
-        await set_default_test_config(primary)
+    await asyncio.gather(
+        *(set_default_test_config(primary) for primary in cluster.primaries)
+    )
 
     async with remapped_slots(cluster, request):
         yield cluster
@@ -862,8 +872,9 @@ async def redis_cluster_blocking(redis_cluster_server, request):
     await cluster.flushall()
     await cluster.flushdb()
 
-    for primary in cluster.primaries:
-        await set_default_test_config(primary)
+    await asyncio.gather(
+        *(set_default_test_config(primary) for primary in cluster.primaries)
+    )
 
     async with remapped_slots(cluster, request):
         yield cluster
@@ -884,8 +895,9 @@ async def redis_cluster_noreplica(redis_cluster_noreplica_server, request):
     await cluster.flushall()
     await cluster.flushdb()
 
-    for primary in cluster.primaries:
-        await set_default_test_config(primary)
+    await asyncio.gather(
+        *(set_default_test_config(primary) for primary in cluster.primaries)
+    )
 
     async with remapped_slots(cluster, request):
         yield cluster
@@ -910,8 +922,9 @@ async def redis_cluster_ssl(redis_ssl_cluster_server, request):
     await cluster.flushall()
     await cluster.flushdb()
 
-    for primary in cluster.primaries:
-        await set_default_test_config(primary)
+    await asyncio.gather(
+        *(set_default_test_config(primary) for primary in cluster.primaries)
+    )
     yield cluster
 
     cluster.connection_pool.disconnect()
@@ -932,8 +945,9 @@ async def redis_cluster_cached(redis_cluster_server, request):
     await cluster.flushall()
     await cluster.flushdb()
 
-    for primary in cluster.primaries:
-        await set_default_test_config(primary)
+    await asyncio.gather(
+        *(set_default_test_config(primary) for primary in cluster.primaries)
+    )
     yield cluster
 
     cluster.connection_pool.disconnect()
@@ -952,8 +966,9 @@ async def redis_cluster_raw(redis_cluster_server, request):
     await cluster.flushall()
     await cluster.flushdb()
 
-    for primary in cluster.primaries:
-        await set_default_test_config(primary)
+    await asyncio.gather(
+        *(set_default_test_config(primary) for primary in cluster.primaries)
+    )
     yield cluster
 
     cluster.connection_pool.disconnect()
@@ -973,8 +988,9 @@ async def redis_cluster_raw_resp2(redis_cluster_server, request):
     await cluster.flushall()
     await cluster.flushdb()
 
-    for primary in cluster.primaries:
-        await set_default_test_config(primary)
+    await asyncio.gather(
+        *(set_default_test_config(primary) for primary in cluster.primaries)
+    )
     yield cluster
 
     cluster.connection_pool.disconnect()
@@ -994,8 +1010,9 @@ async def redis_cluster_resp2(redis_cluster_server, request):
     await cluster.flushall()
     await cluster.flushdb()
 
-    for primary in cluster.primaries:
-        await set_default_test_config(primary)
+    await asyncio.gather(
+        *(set_default_test_config(primary) for primary in cluster.primaries)
+    )
     yield cluster
 
     cluster.connection_pool.disconnect()
@@ -1014,8 +1031,9 @@ async def redis_stack_cluster(redis_stack_cluster_server, request):
     await cluster.flushall()
     await cluster.flushdb()
 
-    for primary in cluster.primaries:
-        await set_default_test_config(primary)
+    await asyncio.gather(
+        *(set_default_test_config(primary) for primary in cluster.primaries)
+    )
 
     async with remapped_slots(cluster, request):
         yield cluster
@@ -1124,67 +1142,71 @@ async def keydb_cluster(keydb_cluster_server, request):
     await cluster.flushall()
     await cluster.flushdb()
 
-    for primary in cluster.primaries:
-        await set_default_test_config(primary, variant="keydb")
+    await asyncio.gather(
+        *(
+            set_default_test_config(primary, variant="keydb")
+            for primary in cluster.primaries
+        )
+    )
     yield cluster
 
     cluster.connection_pool.disconnect()
 
 
-@pytest.fixture
-def fake_redis():
-    class _(coredis.client.Redis):
-        responses = {}
+class FakeRedis(coredis.client.Redis):
+    def __init__(self):
+        self.cache = None
+        self.responses = {}
 
-        def __init__(self):
-            self.cache = None
+    async def initialize(self):
+        pass
 
-        async def initialize(self):
-            pass
+    async def execute_command(
+        self,
+        command: bytes,
+        *args: ValueT,
+        callback: Callable[..., R] = NoopCallback(),
+        **options: Optional[ValueT],
+    ) -> R:
+        resp = self.responses.get(command, {}).get(args)
 
-        async def execute_command(
-            self,
-            command: bytes,
-            *args: ValueT,
-            callback: Callable[..., R] = NoopCallback(),
-            **options: Optional[ValueT],
-        ) -> R:
-            resp = self.responses.get(command, {}).get(args)
+        if isinstance(resp, Exception):
+            raise resp
 
-            if isinstance(resp, Exception):
-                raise resp
+        return callback(resp, **options)
 
-            return callback(resp, **options)
 
-    return _()
+class FakeRedisCluster(coredis.client.RedisCluster):
+    def __init__(self):
+        self.cache = None
+        self.responses = {}
 
+    async def initialize(self):
+        pass
 
-@pytest.fixture
-def fake_redis_cluster():
-    class _(coredis.client.RedisCluster):
-        responses = {}
+    async def execute_command(
+        self,
+        command: bytes,
+        *args: ValueT,
+        callback: Callable[..., R] = NoopCallback(),
+        **options: Optional[ValueT],
+    ) -> R:
+        resp = self.responses.get(command, {}).get(args)
 
-        def __init__(self):
-            self.cache = None
+        if isinstance(resp, Exception):
+            raise resp
 
-        async def initialize(self):
-            pass
+        return callback(resp, **options)
 
-        async def execute_command(
-            self,
-            command: bytes,
-            *args: ValueT,
-            callback: Callable[..., R] = NoopCallback(),
-            **options: Optional[ValueT],
-        ) -> R:
-            resp = self.responses.get(command, {}).get(args)
 
-            if isinstance(resp, Exception):
-                raise resp
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
 
-            return callback(resp, **options)
 
-    return _()
+@pytest.fixture
+def fake_redis_cluster():
+    return FakeRedisCluster()
 
 
 @pytest.fixture
@@ -1300,7 +1322,7 @@ async def user_client(client, cloner):
 
 @contextlib.contextmanager
 def server_deprecation_warning(message: str, client, since: str = "1.0"):
-    if version.parse(since) <= REDIS_VERSIONS[str(client)]:
+    if parse_version(since) <= REDIS_VERSIONS[str(client)]:
         with pytest.warns(DeprecationWarning, match=message):
             yield
     else:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import time
 import uuid
 from unittest.mock import PropertyMock
@@ -29,8 +30,9 @@ class TestLock:
     async def test_lock(self, client, _s, lock_name):
         lock = LuaLock(client, lock_name, blocking=False)
         assert await lock.acquire()
-        assert await client.get(lock_name) == _s(lock.local.get())
-        assert await client.ttl(lock_name) == -1
+        value, ttl = await asyncio.gather(client.get(lock_name), client.ttl(lock_name))
+        assert value == _s(lock.local.get())
+        assert ttl == -1
         await lock.release()
         assert await client.get(lock_name) is None
 